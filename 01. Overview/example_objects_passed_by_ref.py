@@ -7,6 +7,8 @@ from utils.logger import setup_logging
 logger = setup_logging()
 
 class Person:
+    __slots__ = ('name', 'age')
+    
     def __init__(self, name, age):
         self.name = name
         self.age = age
@@ -16,18 +18,18 @@ class Person:
 
 # Function to modify object attributes
 def modify_person(person):
-    logger.info(f"Inside function - Before: {person}")
+    logger.info("Inside function - Before: %s", person)
     person.name = "Modified Name"
     person.age = 999
-    logger.info(f"Inside function - After: {person}")
+    logger.info("Inside function - After: %s", person)
 
 if __name__ == "__main__":
     # Test 1: Modifying object attributes
     logger.info("\n1. MODIFYING OBJECT ATTRIBUTES:")
     logger.info("-" * 40)
     person1 = Person("Alice", 25)
-    logger.info(f"Original: {person1}")
+    logger.info("Original: %s", person1)
     modify_person(person1)
-    logger.info(f"After function call: {person1}")
+    logger.info("After function call: %s", person1)
     logger.info("(Objects are passed by reference)")
     
\ No newline at end of file
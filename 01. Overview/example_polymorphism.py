@@ -5,6 +5,8 @@ logger = setup_logging()
 
 # Parent class (Abstract Base class)
 class Animal(ABC):
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
     
@@ -18,11 +20,15 @@ class Animal(ABC):
 
 # Child class 1
 class Dog(Animal):
+    __slots__ = ()
+    
     def make_sound(self):
         return "Woof! Woof!"
 
 # Child class 2
 class Cat(Animal):
+    __slots__ = ()
+    
     def make_sound(self):
         return "Meow! Meow!"
 
@@ -1,4 +1,31 @@
 from abc import ABC, abstractmethod
+from enum import IntEnum
+from typing import ClassVar
+
+# Discount types - index into the rate and description tables below
+class DiscountType(IntEnum):
+    NONE = 0
+    STUDENT = 1
+    VIP = 2
+    SENIOR = 3
+
+# Rate and description tables, indexed by DiscountType
+DISCOUNT_RATES = (0.0, 0.10, 0.20, 0.15)
+DISCOUNT_DESCRIPTIONS = (
+    "No discount applied",
+    "Student discount: 10% off",
+    "VIP discount: 20% off",
+    "Senior discount: 15% off",
+)
+
+def apply_discount(prices, rate):
+    """
+    Sum prices and apply a discount rate in one pass.
+    Returns (subtotal, discount, total).
+    """
+    subtotal = sum(prices)
+    discount = subtotal * rate
+    return subtotal, discount, subtotal - discount
 
 # Strategy Interface - defines the contract for all strategies
 class DiscountStrategy(ABC):
@@ -7,52 +34,84 @@ class DiscountStrategy(ABC):
     This is the contract that all discount strategies must follow.
     """
     
+    # Strategies are stateless: no per-instance attributes
+    __slots__ = ()
+    
+    # Description of the strategy, defined once per class
+    DESCRIPTION: ClassVar[str]
+    
     @abstractmethod
-    def calculate_discount(self, price):
+    def calculate_discount(self, price: float) -> float:
         """Calculate discount amount for given price"""
         pass
     
-    @abstractmethod
     def get_description(self):
         """Get description of the discount strategy"""
-        pass
+        return self.DESCRIPTION
+    
+    @classmethod
+    def from_id(cls, discount_type):
+        """Create the strategy registered for the given DiscountType"""
+        return _STRATEGIES_BY_TYPE[DiscountType(discount_type)]()
 
 # Concrete Strategy 1: No Discount
 class NoDiscountStrategy(DiscountStrategy):
     """Strategy for regular customers with no discount"""
     
-    def calculate_discount(self, price):
-        return 0
+    __slots__ = ()
     
-    def get_description(self):
-        return "No discount applied"
+    RATE = DISCOUNT_RATES[DiscountType.NONE]
+    DESCRIPTION = DISCOUNT_DESCRIPTIONS[DiscountType.NONE]
+    
+    def calculate_discount(self, price: float) -> float:
+        return 0.0
 
 # Concrete Strategy 2: Student Discount
 class StudentDiscountStrategy(DiscountStrategy):
     """Strategy for student customers with 10% discount"""
     
-    def calculate_discount(self, price):
-        return price * 0.10  # 10% discount
+    __slots__ = ()
     
-    def get_description(self):
-        return "Student discount: 10% off"
+    RATE = DISCOUNT_RATES[DiscountType.STUDENT]
+    DESCRIPTION = DISCOUNT_DESCRIPTIONS[DiscountType.STUDENT]
+    
+    def calculate_discount(self, price: float) -> float:
+        return price * self.RATE  # 10% discount
 
 # Concrete Strategy 3: VIP Discount
 class VIPDiscountStrategy(DiscountStrategy):
     """Strategy for VIP customers with 20% discount"""
     
-    def calculate_discount(self, price):
-        return price * 0.20  # 20% discount
+    __slots__ = ()
     
-    def get_description(self):
-        return "VIP discount: 20% off"
+    RATE = DISCOUNT_RATES[DiscountType.VIP]
+    DESCRIPTION = DISCOUNT_DESCRIPTIONS[DiscountType.VIP]
+    
+    def calculate_discount(self, price: float) -> float:
+        return price * self.RATE  # 20% discount
 
 # Concrete Strategy 4: Senior Discount
 class SeniorDiscountStrategy(DiscountStrategy):
     """Strategy for senior customers with 15% discount"""
     
-    def calculate_discount(self, price):
-        return price * 0.15  # 15% discount
+    __slots__ = ()
     
-    def get_description(self):
-        return "Senior discount: 15% off"
\ No newline at end of file
+    RATE = DISCOUNT_RATES[DiscountType.SENIOR]
+    DESCRIPTION = DISCOUNT_DESCRIPTIONS[DiscountType.SENIOR]
+    
+    def calculate_discount(self, price: float) -> float:
+        return price * self.RATE  # 15% discount
+
+# Strategy lookup used by DiscountStrategy.from_id
+_STRATEGIES_BY_TYPE = {
+    DiscountType.NONE: NoDiscountStrategy,
+    DiscountType.STUDENT: StudentDiscountStrategy,
+    DiscountType.VIP: VIPDiscountStrategy,
+    DiscountType.SENIOR: SeniorDiscountStrategy,
+}
+
+# Shared strategy instances
+NO_DISCOUNT = NoDiscountStrategy()
+STUDENT = StudentDiscountStrategy()
+VIP = VIPDiscountStrategy()
+SENIOR = SeniorDiscountStrategy()
\ No newline at end of file
@@ -1,14 +1,25 @@
+from types import MappingProxyType
 from utils.logger import setup_logging
 from discounts import (
-    DiscountStrategy, 
-    NoDiscountStrategy,
-    VIPDiscountStrategy,
-    SeniorDiscountStrategy,
-    StudentDiscountStrategy
+    DISCOUNT_RATES,
+    NO_DISCOUNT,
+    STUDENT,
+    VIP,
+    SENIOR,
+    DiscountStrategy,
+    DiscountType,
+    apply_discount
 )
 
 logger = setup_logging()
 
+# Banner separators used in the demo output
+_BAR60 = "=" * 60
+_BAR40 = "=" * 40
+_BAR35 = "=" * 35
+_DASH40 = "-" * 40
+_DASH30 = "-" * 30
+
 # Context Class - uses the strategy
 class ShoppingCart:
     """
@@ -16,38 +27,95 @@ class ShoppingCart:
     This class can change its behavior by switching strategies at runtime.
     """
     
+    __slots__ = ('_names', '_prices', '_subtotal', '_discount_strategy', '_calculate_discount')
+    
     def __init__(self, discount_strategy=None):
-        self.items = []
-        self.discount_strategy = discount_strategy or NoDiscountStrategy()
+        # Names and prices are kept in parallel lists; the running subtotal
+        # is updated as items are added so totals never re-scan the cart
+        self._names = []
+        self._prices = []
+        self._subtotal = 0.0
+        self.discount_strategy = discount_strategy or NO_DISCOUNT
+    
+    @property
+    def discount_strategy(self):
+        """The current discount strategy"""
+        return self._discount_strategy
+    
+    @discount_strategy.setter
+    def discount_strategy(self, strategy):
+        # Bind the strategy's calculate_discount once so totals call it directly
+        self._discount_strategy = strategy
+        self._calculate_discount = strategy.calculate_discount
+    
+    @property
+    def items(self):
+        """
+        Read-only snapshot of the cart as name/price mappings.
+        Use add_item() to change the cart; the snapshot cannot be modified.
+        """
+        return tuple(
+            MappingProxyType({"name": name, "price": price})
+            for name, price in zip(self._names, self._prices)
+        )
     
     def add_item(self, name, price):
         """Add an item to the cart"""
-        self.items.append({"name": name, "price": price})
+        price = float(price)
+        self._names.append(name)
+        self._prices.append(price)
+        self._subtotal += price
         logger.info(f"Added {name} (${price:.2f}) to cart")
     
     def set_discount_strategy(self, strategy):
         """Change the discount strategy at runtime"""
         self.discount_strategy = strategy
-        logger.info(f"Discount strategy changed to: {strategy.get_description()}")
+        logger.info(f"Discount strategy changed to: {strategy.DESCRIPTION}")
     
     def calculate_total(self):
         """Calculate total with current discount strategy"""
-        subtotal = sum(item["price"] for item in self.items)
-        discount = self.discount_strategy.calculate_discount(subtotal)
+        subtotal = self._subtotal
+        discount = self._calculate_discount(subtotal)
         total = subtotal - discount
         
         logger.info(f"Subtotal: ${subtotal:.2f}")
-        logger.info(f"Discount: ${discount:.2f} ({self.discount_strategy.get_description()})")
+        logger.info(f"Discount: ${discount:.2f} ({self._discount_strategy.DESCRIPTION})")
         logger.info(f"Total: ${total:.2f}")
         logger.info("")
         
         return total
+    
+    @staticmethod
+    def calculate_totals(price_lists, discount=DiscountType.NONE):
+        """Calculate totals for many carts (one list of prices per cart) with one discount"""
+        price_lists = list(price_lists)
+        return ShoppingCart.batch_totals(price_lists, [discount] * len(price_lists))
+    
+    @staticmethod
+    def batch_totals(price_lists, discounts):
+        """
+        Calculate totals for many carts, each with its own discount.
+        A discount is either a DiscountType or a DiscountStrategy instance.
+        """
+        if len(price_lists) != len(discounts):
+            error_msg = f"Got {len(price_lists)} carts but {len(discounts)} discounts"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        totals = []
+        for prices, discount in zip(price_lists, discounts):
+            if isinstance(discount, DiscountStrategy):
+                subtotal = sum(prices)
+                totals.append(subtotal - discount.calculate_discount(subtotal))
+            else:
+                # DiscountType() rejects unknown ids instead of indexing the rate table with them
+                totals.append(apply_discount(prices, DISCOUNT_RATES[DiscountType(discount)])[2])
+        return totals
 
 def demonstrate_strategy_pattern():
     """Demonstrate how Strategy Pattern works"""
     
     logger.info("STRATEGY PATTERN EXAMPLE - Shopping Cart Discounts")
-    logger.info("=" * 60)
+    logger.info(_BAR60)
     
     # Create shopping cart
     cart = ShoppingCart()
@@ -60,25 +128,25 @@ def demonstrate_strategy_pattern():
     
     # Scenario 1: Regular customer (no discount)
     logger.info("SCENARIO 1: Regular Customer")
-    logger.info("-" * 30)
+    logger.info(_DASH30)
     cart.calculate_total()
     
     # Scenario 2: Student customer
     logger.info("SCENARIO 2: Student Customer")
-    logger.info("-" * 30)
-    cart.set_discount_strategy(StudentDiscountStrategy())
+    logger.info(_DASH30)
+    cart.set_discount_strategy(STUDENT)
     cart.calculate_total()
     
     # Scenario 3: VIP customer
     logger.info("SCENARIO 3: VIP Customer")
-    logger.info("-" * 30)
-    cart.set_discount_strategy(VIPDiscountStrategy())
+    logger.info(_DASH30)
+    cart.set_discount_strategy(VIP)
     cart.calculate_total()
     
     # Scenario 4: Senior customer
     logger.info("SCENARIO 4: Senior Customer")
-    logger.info("-" * 30)
-    cart.set_discount_strategy(SeniorDiscountStrategy())
+    logger.info(_DASH30)
+    cart.set_discount_strategy(SENIOR)
     cart.calculate_total()
 
 if __name__ == "__main__":
@@ -86,7 +154,7 @@ if __name__ == "__main__":
     
     
     logger.info("WHY USE STRATEGY PATTERN?")
-    logger.info("=" * 40)
+    logger.info(_BAR40)
     logger.info("✓ FLEXIBILITY: Easy to switch between different algorithms")
     logger.info("✓ EXTENSIBILITY: Add new discount types without changing existing code")
     logger.info("✓ RUNTIME CHANGES: Change behavior during program execution")
@@ -95,7 +163,7 @@ if __name__ == "__main__":
     logger.info("")
     
     logger.info("WITHOUT STRATEGY PATTERN (Problems):")
-    logger.info("-" * 40)
+    logger.info(_DASH40)
     logger.info("✗ Long if-else chains for different discount types")
     logger.info("✗ Violates Open-Closed Principle (modify existing code)")
     logger.info("✗ Hard to test individual discount logic")
@@ -103,7 +171,7 @@ if __name__ == "__main__":
     logger.info("")
     
     logger.info("WITH STRATEGY PATTERN (Solutions):")
-    logger.info("-" * 40)
+    logger.info(_DASH40)
     logger.info("✓ Each discount type is a separate class")
     logger.info("✓ Easy to add new discount types")
     logger.info("✓ Cart doesn't need to know discount details")
@@ -111,7 +179,7 @@ if __name__ == "__main__":
 
     
     logger.info("STRATEGY PATTERN STRUCTURE:")
-    logger.info("=" * 35)
+    logger.info(_BAR35)
     logger.info("1. Strategy Interface: DiscountStrategy (defines contract)")
     logger.info("2. Concrete Strategies: NoDiscount, Student, VIP, Senior")
     logger.info("3. Context: ShoppingCart (uses strategies)")
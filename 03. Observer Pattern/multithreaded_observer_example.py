@@ -4,8 +4,12 @@ Multithreaded Observer Pattern Example
 
 This demonstrates the Observer pattern working with multiple threads,
 including thread-safe operations and concurrent notifications.
+Concurrent notifications are also shown with asyncio, where one thread
+interleaves the simulated waits instead of parking an OS thread on each.
 """
 
+import asyncio
+import logging
 import threading
 import time
 import random
@@ -15,10 +19,23 @@ from utils.logger import setup_logging
 # Initialize logger
 logger = setup_logging()
 
+# Per-thread cache of the current thread's name
+_thread_local = threading.local()
+
+
+def _thread_name() -> str:
+    """Return the current thread's name, looking it up only once per thread."""
+    name = getattr(_thread_local, "name", None)
+    if name is None:
+        name = _thread_local.name = threading.current_thread().name
+    return name
+
 
 class Observer(ABC):
     """Observer interface."""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         self.name = name
     
@@ -26,94 +43,157 @@ class Observer(ABC):
     def update(self, subject, message: str):
         """Receive update from subject."""
         pass
+    
+    async def update_async(self, subject, message: str):
+        """Receive update from subject inside an event loop.
+        
+        Defaults to running the blocking update() in a worker thread;
+        observers that only wait should override this with asyncio.sleep.
+        """
+        await asyncio.to_thread(self.update, subject, message)
 
 
 class ThreadSafeSubject:
     """Thread-safe subject that can handle concurrent operations."""
     
+    __slots__ = ('_observers', '_update_fns', '_lock', 'name')
+    
     def __init__(self, name: str = "ThreadSafeSubject"):
-        self._observers = []
-        self._lock = threading.Lock()  # Protect observer list
+        # Copy-on-write: writers replace the dict, readers never need the lock.
+        # Observers are keyed by id(observer) so membership checks are O(1).
+        self._observers = {}
+        self._update_fns = ()  # Bound update methods, in attach order
+        self._lock = threading.Lock()  # Serialize writers
         self.name = name
         logger.info(f"Created thread-safe subject: {self.name}")
     
     def attach(self, observer):
         """Thread-safe attach operation."""
         with self._lock:
-            self._observers.append(observer)
+            observers = dict(self._observers)
+            observers[id(observer)] = observer
+            self._observers = observers
+            self._update_fns = tuple(o.update for o in observers.values())
             logger.info(f"Thread-safe attached observer: {observer.name}")
     
     def detach(self, observer):
         """Thread-safe detach operation."""
         with self._lock:
-            if observer in self._observers:
-                self._observers.remove(observer)
+            if id(observer) in self._observers:
+                observers = dict(self._observers)
+                del observers[id(observer)]
+                self._observers = observers
+                self._update_fns = tuple(o.update for o in observers.values())
                 logger.info(f"Thread-safe detached observer: {observer.name}")
     
     def notify(self, message: str):
         """Thread-safe notify operation."""
-        with self._lock:
-            observers_copy = self._observers.copy()  # Copy to avoid concurrent modification
+        # A single attribute read gives an immutable snapshot, no lock or copy needed
+        update_fns = self._update_fns
+        
+        thread_name = _thread_name()
+        logger.info(f"Notifying {len(update_fns)} observer(s) from thread {thread_name}")
+        
+        # Notify observers from the snapshot so attach/detach never block on delivery
+        for update in update_fns:
+            update(self, message)
+    
+    async def notify_async(self, message: str):
+        """Notify all observers concurrently on the running event loop."""
+        observers_snapshot = self._observers
         
-        thread_name = threading.current_thread().name
-        logger.info(f"Notifying {len(observers_copy)} observer(s) from thread {thread_name}")
+        logger.info("Notifying %d observer(s) from the event loop", len(observers_snapshot))
         
-        # Notify observers outside the lock to avoid blocking other operations
-        for observer in observers_copy:
-            observer.update(self, message)
+        await asyncio.gather(*(observer.update_async(self, message) for observer in observers_snapshot.values()))
 
 
 class WorkerObserver(Observer):
     """Observer that simulates work processing."""
     
+    __slots__ = ('processing_time',)
+    
     def __init__(self, name: str, processing_time: float = 1.0):
         super().__init__(name)
         self.processing_time = processing_time
     
     def update(self, subject, message: str):
-        thread_name = threading.current_thread().name
-        logger.info(f"🔧 Worker '{self.name}' (thread: {thread_name}) started processing: '{message}'")
+        # Only look up the thread name when the records will actually be emitted
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        thread_name = _thread_name() if log_enabled else None
+        if log_enabled:
+            logger.info("🔧 Worker '%s' (thread: %s) started processing: '%s'", self.name, thread_name, message)
         
         # Simulate some work
         time.sleep(self.processing_time)
         
-        logger.info(f"✅ Worker '{self.name}' (thread: {thread_name}) finished processing: '{message}'")
+        if log_enabled:
+            logger.info("✅ Worker '%s' (thread: %s) finished processing: '%s'", self.name, thread_name, message)
+    
+    async def update_async(self, subject, message: str):
+        logger.info("🔧 Worker '%s' started processing: '%s'", self.name, message)
+        
+        # Simulate some work without blocking the event loop
+        await asyncio.sleep(self.processing_time)
+        
+        logger.info("✅ Worker '%s' finished processing: '%s'", self.name, message)
 
 
 class AsyncEmailSubscriber(Observer):
     """Email subscriber that processes notifications asynchronously."""
     
+    __slots__ = ('email',)
+    
     def __init__(self, name: str, email: str):
         super().__init__(name)
         self.email = email
     
     def update(self, subject, message: str):
-        thread_name = threading.current_thread().name
         # Simulate email sending delay
         delay = random.uniform(0.5, 2.0)
         time.sleep(delay)
-        logger.info(f"📬 Email sent to {self.name} ({self.email}) from thread {thread_name}: '{message}'")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📬 Email sent to %s (%s) from thread %s: '%s'",
+                        self.name, self.email, _thread_name(), message)
+    
+    async def update_async(self, subject, message: str):
+        # Simulate email sending delay without blocking the event loop
+        await asyncio.sleep(random.uniform(0.5, 2.0))
+        logger.info("📬 Email sent to %s (%s): '%s'", self.name, self.email, message)
 
 
 class DatabaseLogger(Observer):
     """Observer that logs to a simulated database."""
     
+    __slots__ = ('_lock', '_async_lock')
+    
     def __init__(self, name: str):
         super().__init__(name)
         self._lock = threading.Lock()  # Protect database writes
+        # Protects database writes from coroutines; created on first use because
+        # before Python 3.10 an asyncio.Lock binds to the loop current at creation
+        self._async_lock = None
     
     def update(self, subject, message: str):
-        thread_name = threading.current_thread().name
-        
         # Simulate database write with thread safety
         with self._lock:
-            logger.info(f"💾 Database '{self.name}' (thread: {thread_name}) logging: '{message}'")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("💾 Database '%s' (thread: %s) logging: '%s'",
+                            self.name, _thread_name(), message)
             time.sleep(0.3)  # Simulate database write time
-            logger.info(f"✅ Database '{self.name}' write completed")
+            logger.info("✅ Database '%s' write completed", self.name)
+    
+    async def update_async(self, subject, message: str):
+        # Simulate database write, one coroutine at a time
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            logger.info("💾 Database '%s' logging: '%s'", self.name, message)
+            await asyncio.sleep(0.3)  # Simulate database write time
+            logger.info("✅ Database '%s' write completed", self.name)
 
 
 def demonstrate_concurrent_notifications():
-    """Demonstrate concurrent notifications from multiple threads."""
+    """Demonstrate concurrent notifications from multiple senders on one event loop."""
     logger.info("=== Concurrent Notifications Demo ===")
     
     # Create a thread-safe subject
@@ -133,36 +213,24 @@ def demonstrate_concurrent_notifications():
     event_dispatcher.attach(email2)
     event_dispatcher.attach(db_logger)
     
-    # Function to send notifications from different threads
-    def send_notifications(thread_id: int, num_messages: int):
+    # Coroutine that sends notifications from one sender
+    async def send_notifications(sender_id: int, num_messages: int):
         for i in range(num_messages):
-            message = f"Event-{thread_id}-{i+1}: Processing request from thread {thread_id}"
-            event_dispatcher.notify(message)
-            time.sleep(random.uniform(0.3, 0.8))  # Random delay between notifications
-    
-    # Create multiple threads that will send notifications concurrently
-    threads = []
-    for thread_id in range(1, 4):  # Create 3 notification threads
-        thread = threading.Thread(
-            target=send_notifications, 
-            args=(thread_id, 2),  # Each thread sends 2 messages
-            name=f"NotificationThread-{thread_id}"
-        )
-        threads.append(thread)
-    
-    logger.info("Starting concurrent notification threads...")
-    
-    # Start all threads
-    start_time = time.time()
-    for thread in threads:
-        thread.start()
+            message = f"Event-{sender_id}-{i+1}: Processing request from sender {sender_id}"
+            await event_dispatcher.notify_async(message)
+            await asyncio.sleep(random.uniform(0.3, 0.8))  # Random delay between notifications
+    
+    # Run several senders concurrently on a single event loop
+    async def run_senders():
+        await asyncio.gather(*(send_notifications(sender_id, 2) for sender_id in range(1, 4)))
     
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+    logger.info("Starting concurrent notification senders...")
     
+    start_time = time.time()
+    asyncio.run(run_senders())
     end_time = time.time()
-    logger.info(f"All notification threads completed in {end_time - start_time:.2f} seconds!")
+    
+    logger.info(f"All notification senders completed in {end_time - start_time:.2f} seconds!")
 
 
 def demonstrate_dynamic_observer_management():
@@ -15,31 +15,36 @@ logger = setup_logging()
 class Subject:
     """Maintains observers and notifies them of changes."""
     
+    __slots__ = ('_observers', 'name')
+    
     def __init__(self, name: str = "Subject"):
-        self._observers = []
+        # Bound update methods keyed by id(observer): O(1) attach/detach, insertion-ordered
+        self._observers = {}
         self.name = name
         logger.info(f"Created subject: {self.name}")
     
     def attach(self, observer):
         """Add an observer."""
-        self._observers.append(observer)
+        self._observers[id(observer)] = observer.update
         logger.info(f"Attached observer: {observer.name}")
     
     def detach(self, observer):
         """Remove an observer."""
-        self._observers.remove(observer)
-        logger.info(f"Detached observer: {observer.name}")
+        if self._observers.pop(id(observer), None) is not None:
+            logger.info(f"Detached observer: {observer.name}")
     
     def notify(self, message: str):
         """Notify all observers."""
         logger.info(f"Notifying {len(self._observers)} observer(s): '{message}'")
-        for observer in self._observers:
-            observer.update(self, message)
+        for update in self._observers.values():
+            update(self, message)
 
 
 class Observer(ABC):
     """Observer interface."""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         self.name = name
     
@@ -52,6 +57,8 @@ class Observer(ABC):
 class ConcreteObserver(Observer):
     """Basic observer that logs received messages."""
     
+    __slots__ = ()
+    
     def update(self, subject, message: str):
         logger.info(f"Observer '{self.name}' received: '{message}' from '{subject.name}'")
 
@@ -59,6 +66,8 @@ class ConcreteObserver(Observer):
 class EmailSubscriber(Observer):
     """Observer for email notifications."""
     
+    __slots__ = ('email',)
+    
     def __init__(self, name: str, email: str):
         super().__init__(name)
         self.email = email
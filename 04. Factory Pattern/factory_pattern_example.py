@@ -16,6 +16,8 @@ logger = setup_logging()
 class Animal(ABC):
     """Abstract animal class."""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name: str):
         self.name = name
         logger.info(f"Created {self.__class__.__name__}: {self.name}")
@@ -34,6 +36,8 @@ class Animal(ABC):
 class Dog(Animal):
     """Dog implementation."""
     
+    __slots__ = ()
+    
     def make_sound(self) -> str:
         sound = "Woof!"
         logger.info(f"Dog {self.name} says: {sound}")
@@ -48,6 +52,8 @@ class Dog(Animal):
 class Cat(Animal):
     """Cat implementation."""
     
+    __slots__ = ()
+    
     def make_sound(self) -> str:
         sound = "Meow!"
         logger.info(f"Cat {self.name} says: {sound}")
@@ -62,6 +68,8 @@ class Cat(Animal):
 class Bird(Animal):
     """Bird implementation."""
     
+    __slots__ = ()
+    
     def make_sound(self) -> str:
         sound = "Tweet!"
         logger.info(f"Bird {self.name} says: {sound}")
@@ -83,6 +91,9 @@ class AnimalFactory:
         'bird': Bird
     }
     
+    # Fixed at class definition, so it is built once instead of per call
+    _AVAILABLE_TYPES = tuple(_animal_types)
+    
     @classmethod
     def create_animal(cls, animal_type: str, name: str) -> Animal:
         """
@@ -98,23 +109,24 @@ class AnimalFactory:
         Raises:
             ValueError: If animal_type is not supported
         """
-        animal_type = animal_type.lower()
+        # Try the name as given first; only normalize the case on a miss
+        animal_class = cls._animal_types.get(animal_type)
+        if animal_class is None:
+            animal_type = animal_type.lower()
+            animal_class = cls._animal_types.get(animal_type)
         
-        if animal_type not in cls._animal_types:
-            error_msg = f"Unknown animal type: {animal_type}. Available types: {list(cls._animal_types.keys())}"
+        if animal_class is None:
+            error_msg = f"Unknown animal type: {animal_type}. Available types: {cls._AVAILABLE_TYPES}"
             logger.error(error_msg)
             raise ValueError(error_msg)
         
         logger.info(f"Factory creating {animal_type} named {name}")
-        animal_class = cls._animal_types[animal_type]
         return animal_class(name)
     
     @classmethod
-    def get_available_types(cls) -> list:
-        """Get list of available animal types."""
-        types = list(cls._animal_types.keys())
-        logger.info(f"Available animal types: {types}")
-        return types
+    def get_available_types(cls) -> tuple:
+        """Get the available animal types."""
+        return cls._AVAILABLE_TYPES
 
 
 def demonstrate_factory_pattern():
@@ -6,6 +6,7 @@ This example demonstrates a pizza restaurant that can make different styles of p
 Each factory creates a family of pizza components that work together.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from utils.logger import setup_logging
 
@@ -17,96 +18,122 @@ logger = setup_logging()
 class Dough(ABC):
     """Abstract dough product."""
     
+    __slots__ = ()
+    
+    def __init__(self):
+        logger.debug("Created %s", type(self).__name__)
+    
+    @property
     @abstractmethod
+    def type_name(self) -> str:
+        """Display name of the dough, defined once per concrete class."""
+        pass
+    
     def get_type(self) -> str:
         """Get the dough type."""
-        pass
+        return self.type_name
 
 
 class Sauce(ABC):
     """Abstract sauce product."""
     
+    __slots__ = ()
+    
+    def __init__(self):
+        logger.debug("Created %s", type(self).__name__)
+    
+    @property
     @abstractmethod
+    def type_name(self) -> str:
+        """Display name of the sauce, defined once per concrete class."""
+        pass
+    
     def get_type(self) -> str:
         """Get the sauce type."""
-        pass
+        return self.type_name
 
 
 class Cheese(ABC):
     """Abstract cheese product."""
     
+    __slots__ = ()
+    
+    def __init__(self):
+        logger.debug("Created %s", type(self).__name__)
+    
+    @property
     @abstractmethod
+    def type_name(self) -> str:
+        """Display name of the cheese, defined once per concrete class."""
+        pass
+    
     def get_type(self) -> str:
         """Get the cheese type."""
-        pass
+        return self.type_name
 
 
 # Italian Style Products
 class ItalianDough(Dough):
     """Italian style thin dough."""
     
-    def __init__(self):
-        logger.info("Created Italian thin dough")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "Thin Italian dough"
+    type_name = "Thin Italian dough"
 
 
 class ItalianSauce(Sauce):
     """Italian style tomato sauce."""
     
-    def __init__(self):
-        logger.info("Created Italian tomato sauce")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "Traditional Italian tomato sauce"
+    type_name = "Traditional Italian tomato sauce"
 
 
 class ItalianCheese(Cheese):
     """Italian style mozzarella cheese."""
     
-    def __init__(self):
-        logger.info("Created Italian mozzarella cheese")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "Fresh Italian mozzarella"
+    type_name = "Fresh Italian mozzarella"
 
 
 # American Style Products
 class AmericanDough(Dough):
     """American style thick dough."""
     
-    def __init__(self):
-        logger.info("Created American thick dough")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "Thick American dough"
+    type_name = "Thick American dough"
 
 
 class AmericanSauce(Sauce):
     """American style sauce."""
     
-    def __init__(self):
-        logger.info("Created American sauce")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "Sweet American pizza sauce"
+    type_name = "Sweet American pizza sauce"
 
 
 class AmericanCheese(Cheese):
     """American style cheese blend."""
     
-    def __init__(self):
-        logger.info("Created American cheese blend")
+    __slots__ = ()
     
-    def get_type(self) -> str:
-        return "American cheese blend"
+    type_name = "American cheese blend"
 
 
 # Abstract Factory
 class PizzaIngredientFactory(ABC):
     """Abstract factory for creating pizza ingredients."""
     
+    __slots__ = ()
+    
+    # Display name of the pizza style, e.g. "Italian"
+    name: str
+    
+    # Display name of the factory for log records, e.g. "Italian Pizza Factory"
+    display_name: str
+    
     @abstractmethod
     def create_dough(self) -> Dough:
         """Create dough."""
@@ -123,87 +150,119 @@ class PizzaIngredientFactory(ABC):
         pass
 
 
-# Concrete Factories
-class ItalianPizzaFactory(PizzaIngredientFactory):
-    """Factory for Italian pizza ingredients."""
+# Concrete Factory
+class PizzaStyleFactory(PizzaIngredientFactory):
+    """Factory for one pizza style, parameterized by its ingredient classes."""
     
-    def __init__(self):
-        logger.info("Initialized Italian Pizza Factory")
+    __slots__ = ('name', 'display_name', '_dough_cls', '_sauce_cls', '_cheese_cls')
+    
+    def __init__(self, name: str, dough_cls: type, sauce_cls: type, cheese_cls: type):
+        self.name = name
+        self.display_name = f"{name} Pizza Factory"
+        self._dough_cls = dough_cls
+        self._sauce_cls = sauce_cls
+        self._cheese_cls = cheese_cls
+        logger.debug("Initialized %s", self.display_name)
     
     def create_dough(self) -> Dough:
-        logger.info("Italian factory creating dough")
-        return ItalianDough()
+        return self._dough_cls()
     
     def create_sauce(self) -> Sauce:
-        logger.info("Italian factory creating sauce")
-        return ItalianSauce()
+        return self._sauce_cls()
     
     def create_cheese(self) -> Cheese:
-        logger.info("Italian factory creating cheese")
-        return ItalianCheese()
+        return self._cheese_cls()
 
 
-class AmericanPizzaFactory(PizzaIngredientFactory):
-    """Factory for American pizza ingredients."""
-    
-    def __init__(self):
-        logger.info("Initialized American Pizza Factory")
+# Factory Provider
+class PizzaFactoryProvider:
+    """Hands out one shared ingredient factory per pizza style."""
     
-    def create_dough(self) -> Dough:
-        logger.info("American factory creating dough")
-        return AmericanDough()
+    # Factories are stateless, so each style is built once and reused
+    _factories = {
+        'italian': PizzaStyleFactory("Italian", ItalianDough, ItalianSauce, ItalianCheese),
+        'american': PizzaStyleFactory("American", AmericanDough, AmericanSauce, AmericanCheese),
+    }
     
-    def create_sauce(self) -> Sauce:
-        logger.info("American factory creating sauce")
-        return AmericanSauce()
+    _SUPPORTED_STYLES = tuple(_factories)
     
-    def create_cheese(self) -> Cheese:
-        logger.info("American factory creating cheese")
-        return AmericanCheese()
+    @classmethod
+    def get_factory(cls, style: str) -> PizzaIngredientFactory:
+        """
+        Get the ingredient factory for a pizza style.
+        
+        Args:
+            style: Pizza style ('italian', 'american')
+            
+        Returns:
+            PizzaIngredientFactory: Shared factory instance for the style
+            
+        Raises:
+            ValueError: If style is not supported
+        """
+        factory = cls._factories.get(style)
+        if factory is None:
+            error_msg = f"Unknown pizza style: {style}. Available styles: {cls._SUPPORTED_STYLES}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        return factory
 
 
 # Client
 class Pizza:
     """Pizza that uses ingredients from a factory."""
     
+    __slots__ = ('name', 'factory', 'dough', 'sauce', 'cheese')
+    
     def __init__(self, name: str, factory: PizzaIngredientFactory):
         self.name = name
         self.factory = factory
         self.dough = None
         self.sauce = None
         self.cheese = None
-        logger.info(f"Pizza '{name}' initialized with {factory.__class__.__name__}")
+        logger.debug("Pizza '%s' initialized with %s", name, factory.display_name)
     
     def prepare(self):
         """Prepare the pizza using factory ingredients."""
-        logger.info(f"Preparing {self.name} pizza...")
+        logger.debug("Preparing %s pizza...", self.name)
         
         # Create ingredients using the factory
         self.dough = self.factory.create_dough()
         self.sauce = self.factory.create_sauce()
         self.cheese = self.factory.create_cheese()
         
-        # Display the ingredients
-        logger.info(f"Pizza ingredients:")
-        logger.info(f"  - {self.dough.get_type()}")
-        logger.info(f"  - {self.sauce.get_type()}")
-        logger.info(f"  - {self.cheese.get_type()}")
+        # Display the ingredients as one multi-line record, skipping the
+        # formatting entirely when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Pizza ingredients:\n  - %s\n  - %s\n  - %s",
+                self.dough.type_name, self.sauce.type_name, self.cheese.type_name
+            )
         
-        logger.info(f"{self.name} pizza preparation completed!")
+        logger.debug("%s pizza preparation completed!", self.name)
 
 
 class PizzaRestaurant:
     """Restaurant that can make different styles of pizza."""
     
+    __slots__ = ('factory',)
+    
     def __init__(self, factory: PizzaIngredientFactory):
         self.factory = factory
-        logger.info(f"Pizza Restaurant opened with {factory.__class__.__name__}")
+        logger.info("Pizza Restaurant opened with %s", factory.display_name)
     
     def make_pizza(self, pizza_name: str) -> Pizza:
         """Make a pizza using the restaurant's ingredient factory."""
-        logger.info(f"Restaurant making {pizza_name} pizza")
+        logger.debug("Restaurant making %s pizza", pizza_name)
         pizza = Pizza(pizza_name, self.factory)
         pizza.prepare()
+        
+        # One summary record per pizza; the individual steps are logged at DEBUG
+        logger.info(
+            "Made %s pizza with %s: %s, %s, %s",
+            pizza_name, self.factory.display_name,
+            pizza.dough.type_name, pizza.sauce.type_name, pizza.cheese.type_name
+        )
         return pizza
 
 
@@ -213,7 +272,7 @@ def demonstrate_abstract_factory():
     
     # Italian restaurant
     logger.info("\n--- Italian Pizza Restaurant ---")
-    italian_factory = ItalianPizzaFactory()
+    italian_factory = PizzaFactoryProvider.get_factory("italian")
     italian_restaurant = PizzaRestaurant(italian_factory)
     italian_pizza = italian_restaurant.make_pizza("Margherita")
     
@@ -221,7 +280,7 @@ def demonstrate_abstract_factory():
     
     # American restaurant
     logger.info("\n--- American Pizza Restaurant ---")
-    american_factory = AmericanPizzaFactory()
+    american_factory = PizzaFactoryProvider.get_factory("american")
     american_restaurant = PizzaRestaurant(american_factory)
     american_pizza = american_restaurant.make_pizza("Pepperoni")
     
@@ -230,7 +289,7 @@ def demonstrate_abstract_factory():
     # Restaurant changing style
     logger.info("\n--- Restaurant Changing Style ---")
     logger.info("Italian restaurant switching to American style...")
-    italian_restaurant.factory = american_factory
+    italian_restaurant.factory = PizzaFactoryProvider.get_factory("american")  # Same shared instance
     fusion_pizza = italian_restaurant.make_pizza("Fusion")
 
 
@@ -243,7 +302,7 @@ def main():
         logger.info("✅ Demo completed successfully!")
         
     except Exception as e:
-        logger.error(f"❌ Error: {e}")
+        logger.error("❌ Error: %s", e)
         raise
 
 
@@ -18,18 +18,16 @@ class DatabaseConnection:
     _instance = None
     
     def __new__(cls):
+        # All setup happens here, once; there is no __init__ to re-run
+        # on later DatabaseConnection() calls
         if cls._instance is None:
             logger.info("Creating new DatabaseConnection instance")
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        if not self._initialized:
-            self.connection_string = "postgresql://localhost:5432/myapp"
-            self.is_connected = False
-            self._initialized = True
+            instance = super().__new__(cls)
+            instance.connection_string = "postgresql://localhost:5432/myapp"
+            instance.is_connected = False
+            cls._instance = instance
             logger.info("DatabaseConnection initialized")
+        return cls._instance
     
     def connect(self):
         if not self.is_connected:
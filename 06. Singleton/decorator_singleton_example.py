@@ -16,16 +16,18 @@ def singleton(cls):
     Decorator that converts any class into a thread-safe singleton.
     Usage: @singleton
     """
-    instances = {}
+    instance = None
     lock = threading.Lock()
     
     def get_instance(*args, **kwargs):
-        if cls not in instances:
+        nonlocal instance
+        # Once created, the fast path is a single closure-cell check
+        if instance is None:
             with lock:
-                if cls not in instances:
+                if instance is None:
                     logger.info(f"Creating new {cls.__name__} instance")
-                    instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+                    instance = cls(*args, **kwargs)
+        return instance
     
     return get_instance
 
@@ -67,6 +69,9 @@ class CacheManager:
         self.cache = {}
         self.hits = 0
         self.misses = 0
+        # Last formatted hit rate and the (hits, misses) it was built from
+        self._hit_rate_key = None
+        self._hit_rate = None
         logger.info("CacheManager initialized")
     
     def get(self, key):
@@ -84,9 +89,14 @@ class CacheManager:
         logger.info(f"Cache SET: {key}")
     
     def get_stats(self):
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
-        return {"hits": self.hits, "misses": self.misses, "hit_rate": f"{hit_rate:.1f}%"}
+        # Only the formatted hit rate is cached; callers get a fresh dict each time
+        key = (self.hits, self.misses)
+        if key != self._hit_rate_key:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            self._hit_rate = f"{hit_rate:.1f}%"
+            self._hit_rate_key = key
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self._hit_rate}
 
 
 def demonstrate_decorator_singleton():
@@ -6,7 +6,10 @@ using module-level instances. Modules are naturally singletons in Python.
 """
 
 from utils.logger import setup_logging
+import logging
 import threading
+import weakref
+from types import MappingProxyType
 
 logger = setup_logging()
 
@@ -17,30 +20,55 @@ class _Settings:
     The underscore prefix indicates it's private to this module.
     """
     
+    __slots__ = ('_inited', 'config', '_config_view', '_lock')
+    
     def __init__(self):
+        # Running __init__ again must not wipe the shared state
+        if getattr(self, '_inited', False):
+            return
+        self._inited = True
+        
         self.config = {
             "app_name": "My Application",
             "debug": False,
             "max_connections": 10
         }
-        self._lock = threading.RLock()
+        # Copy-on-write: set() replaces self.config and this read-only view,
+        # so a view handed out by get_all is a snapshot that never changes
+        self._config_view = MappingProxyType(self.config)
+        self._lock = threading.Lock()
         logger.info("Settings initialized (Module-level Singleton)")
     
     def get(self, key):
         with self._lock:
             value = self.config.get(key)
-            logger.info(f"Settings GET - {key}: {value}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Settings GET - %s: %s", key, value)
             return value
     
     def set(self, key, value):
         with self._lock:
-            old_value = self.config.get(key)
-            self.config[key] = value
-            logger.info(f"Settings SET - {key}: {old_value} -> {value}")
+            config = self.config.copy()
+            config[key] = value
+            # The old value is only needed for the log record
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Settings SET - %s: %s -> %s", key, self.config.get(key), value)
+            self.config = config
+            self._config_view = MappingProxyType(config)
     
     def get_all(self):
-        with self._lock:
-            return self.config.copy()
+        """Return a read-only snapshot of all settings."""
+        return self._config_view
+
+
+class _CacheCounters:
+    """Hit/miss counters owned by a single thread."""
+    
+    __slots__ = ('hits', 'misses')
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
 
 
 class _Cache:
@@ -49,34 +77,82 @@ class _Cache:
     Simple caching system.
     """
     
+    __slots__ = ('_inited', 'data', '_write_lock', '_local', '_counters',
+                 '_base_hits', '_base_misses', '_stats_lock')
+    
     def __init__(self):
+        # Running __init__ again must not wipe the shared state
+        if getattr(self, '_inited', False):
+            return
+        self._inited = True
+        
+        # Copy-on-write: writers replace self.data with an updated copy,
+        # so readers can use whichever dict they see without locking
         self.data = {}
-        self.hits = 0
-        self.misses = 0
-        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        
+        # Each thread counts its own hits/misses; get_stats sums them.
+        # Counts of finished threads are folded into the base totals, so
+        # _counters only keeps (thread ref, counters) pairs of live threads
+        self._local = threading.local()
+        self._counters = []
+        self._base_hits = 0
+        self._base_misses = 0
+        self._stats_lock = threading.Lock()
         logger.info("Cache initialized (Module-level Singleton)")
     
-    def get(self, key):
-        with self._lock:
-            if key in self.data:
-                self.hits += 1
-                logger.info(f"Cache HIT: {key}")
-                return self.data[key]
+    def _thread_counters(self):
+        """Return the calling thread's counters, registering them on first use."""
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = _CacheCounters()
+            with self._stats_lock:
+                self._fold_finished_threads()
+                self._counters.append((weakref.ref(threading.current_thread()), counters))
+            return counters
+    
+    def _fold_finished_threads(self):
+        """Move the counts of finished threads into the base totals (hold _stats_lock)."""
+        live = []
+        for thread_ref, counters in self._counters:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, counters))
             else:
-                self.misses += 1
-                logger.info(f"Cache MISS: {key}")
-                return None
+                self._base_hits += counters.hits
+                self._base_misses += counters.misses
+        self._counters = live
+    
+    def get(self, key):
+        data = self.data
+        if key in data:
+            self._thread_counters().hits += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cache HIT: %s", key)
+            return data[key]
+        else:
+            self._thread_counters().misses += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cache MISS: %s", key)
+            return None
     
     def set(self, key, value):
-        with self._lock:
-            self.data[key] = value
-            logger.info(f"Cache SET: {key}")
+        with self._write_lock:
+            data = self.data.copy()
+            data[key] = value
+            self.data = data
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cache SET: %s", key)
     
     def get_stats(self):
-        with self._lock:
-            total = self.hits + self.misses
-            hit_rate = (self.hits / total * 100) if total > 0 else 0
-            return {"hits": self.hits, "misses": self.misses, "hit_rate": f"{hit_rate:.1f}%"}
+        with self._stats_lock:
+            self._fold_finished_threads()
+            hits = self._base_hits + sum(counters.hits for _, counters in self._counters)
+            misses = self._base_misses + sum(counters.misses for _, counters in self._counters)
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
+        return {"hits": hits, "misses": misses, "hit_rate": f"{hit_rate:.1f}%"}
 
 
 # Create the singleton instances at module level
@@ -145,27 +221,26 @@ def test_thread_safety():
     """Test thread safety of module-level singletons."""
     logger.info("\n=== Thread Safety Test ===")
     
-    results = []
+    # One slot per thread, so workers never share a list
+    results = [None] * 3
     
-    def worker_thread():
+    def worker_thread(index):
         thread_name = threading.current_thread().name
         
-        # Import and use singletons
-        from module_singleton_example import app_settings, app_cache
-        
+        # Use the module-level singletons directly
         app_settings.set(f"thread_{thread_name}", thread_name)
         app_cache.set(f"cache_{thread_name}", f"data_{thread_name}")
         
-        results.append({
+        results[index] = {
             "thread": thread_name,
             "settings_id": id(app_settings),
             "cache_id": id(app_cache)
-        })
+        }
     
     # Create and start threads
     threads = []
     for i in range(3):
-        thread = threading.Thread(target=worker_thread, name=f"Worker-{i}")
+        thread = threading.Thread(target=worker_thread, args=(i,), name=f"Worker-{i}")
         threads.append(thread)
         thread.start()
     
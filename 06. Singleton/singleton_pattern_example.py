@@ -26,46 +26,46 @@ def demonstrate_all_singleton_patterns():
     db1 = DatabaseConnection()
     db2 = DatabaseConnection()
     
-    logger.info(f"Same instance: {db1 is db2}")
+    logger.info("Same instance: %s", db1 is db2)
     db1.connect()
-    logger.info(f"Shared state: {db2.get_status()}")
+    logger.info("Shared state: %s", db2.get_status())
     
     # Method 2: Thread-Safe Singleton
     logger.info("\n--- Method 2: Thread-Safe Singleton (Metaclass) ---")
     config1 = ConfigurationManager()
     config2 = ConfigurationManager()
     
-    logger.info(f"Same instance: {config1 is config2}")
+    logger.info("Same instance: %s", config1 is config2)
     config1.set("debug_mode", True)
-    logger.info(f"Shared state: {config2.get('debug_mode')}")
+    logger.info("Shared state: %s", config2.get('debug_mode'))
     
     # Method 3: Decorator Singleton
     logger.info("\n--- Method 3: Decorator Singleton ---")
     log1 = LoggerManager()
     log2 = LoggerManager()
     
-    logger.info(f"Same instance: {log1 is log2}")
+    logger.info("Same instance: %s", log1 is log2)
     log1.set_level("DEBUG")
-    logger.info(f"Shared config: {log2.get_config()}")
+    logger.info("Shared config: %s", log2.get_config())
     
     cache1 = CacheManager()
     cache2 = CacheManager()
     cache1.set("test", "data")
-    logger.info(f"Cache shared: {cache2.get('test')}")
+    logger.info("Cache shared: %s", cache2.get('test'))
     
     # Method 4: Module-level Singleton
     logger.info("\n--- Method 4: Module-level Singleton (Most Pythonic) ---")
     settings1 = app_settings
     settings2 = app_settings
     
-    logger.info(f"Same instance: {settings1 is settings2}")
+    logger.info("Same instance: %s", settings1 is settings2)
     settings1.set("test_mode", True)
-    logger.info(f"Shared state: {settings2.get('test_mode')}")
+    logger.info("Shared state: %s", settings2.get('test_mode'))
     
     cache1 = app_cache
     cache2 = app_cache
     cache1.set("module_test", "module_data")
-    logger.info(f"Module cache shared: {cache2.get('module_test')}")
+    logger.info("Module cache shared: %s", cache2.get('module_test'))
 
 
 def compare_implementations():
@@ -80,30 +80,33 @@ def compare_implementations():
     }
     
     for name, instance in implementations.items():
-        logger.info(f"{name} Singleton ID: {id(instance)}")
+        logger.info("%s Singleton ID: %d", name, id(instance))
     
     # Verify singleton behavior
     logger.info("\nSingleton Verification:")
-    logger.info(f"Basic: {DatabaseConnection() is DatabaseConnection()}")
-    logger.info(f"Thread-Safe: {ConfigurationManager() is ConfigurationManager()}")
-    logger.info(f"Decorator: {LoggerManager() is LoggerManager()}")
-    logger.info(f"Module-level: Always same by import")
+    logger.info("Basic: %s", DatabaseConnection() is DatabaseConnection())
+    logger.info("Thread-Safe: %s", ConfigurationManager() is ConfigurationManager())
+    logger.info("Decorator: %s", LoggerManager() is LoggerManager())
+    logger.info("Module-level: Always same by import")
 
 
 def test_thread_safety():
     """Test thread safety across implementations."""
     logger.info("\n=== Thread Safety Test ===")
     
-    results = {"basic": [], "threadsafe": [], "decorator": [], "module": []}
+    # One slot per thread, so workers never share a list
+    results = [None] * 3
     
-    def worker():
-        results["basic"].append(id(DatabaseConnection()))
-        results["threadsafe"].append(id(ConfigurationManager()))
-        results["decorator"].append(id(LoggerManager()))
-        results["module"].append(id(app_settings))
+    def worker(index):
+        results[index] = {
+            "basic": id(DatabaseConnection()),
+            "threadsafe": id(ConfigurationManager()),
+            "decorator": id(LoggerManager()),
+            "module": id(app_settings)
+        }
     
     # Create threads
-    threads = [threading.Thread(target=worker) for _ in range(3)]
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(3)]
     
     # Start and wait
     for t in threads:
@@ -112,9 +115,9 @@ def test_thread_safety():
         t.join()
     
     # Check results
-    for name, ids in results.items():
-        unique = len(set(ids))
-        logger.info(f"{name}: {unique} unique ID(s) (should be 1)")
+    for name in results[0]:
+        unique = len({result[name] for result in results})
+        logger.info("%s: %s unique ID(s) (should be 1)", name, unique)
 
 
 if __name__ == "__main__":
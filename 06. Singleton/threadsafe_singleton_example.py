@@ -16,16 +16,24 @@ class SingletonMeta(type):
     Thread-safe Singleton metaclass.
     Any class using this metaclass will have only one instance.
     """
-    _instances = {}
-    _lock = threading.Lock()
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One lock per singleton class, so unrelated singletons
+        # never wait on each other's construction
+        cls._singleton_lock = threading.Lock()
     
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
+        # The instance lives on the class itself; reading cls.__dict__
+        # directly keeps a subclass from picking up its parent's instance
+        instance = cls.__dict__.get('_singleton_instance')
+        if instance is None:
+            with cls._singleton_lock:
+                instance = cls.__dict__.get('_singleton_instance')
+                if instance is None:
                     logger.info(f"Creating new {cls.__name__} instance")
-                    cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+                    instance = super().__call__(*args, **kwargs)
+                    cls._singleton_instance = instance
+        return instance
 
 
 class ConfigurationManager(metaclass=SingletonMeta):
@@ -34,6 +42,8 @@ class ConfigurationManager(metaclass=SingletonMeta):
     Manages application settings.
     """
     
+    __slots__ = ('config',)
+    
     def __init__(self):
         self.config = {
             "debug_mode": False,
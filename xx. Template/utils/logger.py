@@ -2,12 +2,40 @@ import logging
 import sys
 import time
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo  # Python 3.9+, or use pytz for older versions
 from .constants import DATE_FORMAT, LOG_COLORS, LOG_FORMAT,LOG_LEVEL
-from colorlog import ColoredFormatter
 
-class TimezoneAwareFormatter(ColoredFormatter):
-    """Custom formatter that uses timezone-aware local time"""
+# ANSI escape codes for colorlog's color names, e.g. 'red', 'bold_yellow', 'bg_white'
+_COLOR_NAMES = ('black', 'red', 'green', 'yellow', 'blue', 'purple', 'cyan', 'white')
+_COLOR_PREFIXES = (
+    ('', '3'), ('fg_', '3'),
+    ('bold_', '1;3'), ('fg_bold_', '1;3'),
+    ('thin_', '2;3'), ('fg_thin_', '2;3'),
+    ('light_', '9'), ('fg_light_', '9'),
+    ('bg_', '4'), ('bg_bold_', '10'), ('bg_light_', '10'),
+)
+_ANSI = {
+    prefix + name: f'\x1b[{code}{index}m'
+    for prefix, code in _COLOR_PREFIXES
+    for index, name in enumerate(_COLOR_NAMES)
+}
+_ANSI.update(bold='\x1b[1m', thin='\x1b[2m', reset='\x1b[0m')
+_RESET = _ANSI['reset']
+_CYAN = _ANSI['cyan']
+
+def _parse_colors(colors: str) -> str:
+    """Render a colorlog color spec such as 'red,bg_white'; unknown names are ignored."""
+    return ''.join(_ANSI.get(name.strip(), '') for name in colors.split(','))
+
+# Color prefix for each level number, rendered once at import time
+_LEVEL_PREFIX = {
+    logging.getLevelName(level_name): _parse_colors(color)
+    for level_name, color in LOG_COLORS.items()
+}
+
+class TimezoneAwareFormatter(logging.Formatter):
+    """Custom colored formatter that uses timezone-aware local time"""
     
     def __init__(self, *args, timezone: str = 'UTC', **kwargs):
         """
@@ -18,6 +46,31 @@ class TimezoneAwareFormatter(ColoredFormatter):
         """
         super().__init__(*args, **kwargs)
         self.timezone = timezone
+        
+        # Resolve the timezone and date format once instead of per record
+        self._fallback_tz = ZoneInfo('UTC')
+        try:
+            self._tz = ZoneInfo(timezone)
+        except Exception:
+            self._tz = self._fallback_tz
+        self._datefmt = self.datefmt if self.datefmt else DATE_FORMAT
+        
+        # Records logged within the same second share one formatted timestamp,
+        # unless the format shows sub-second precision
+        self._format_second = None
+        if '%f' not in self._datefmt:
+            self._format_second = lru_cache(maxsize=4)(
+                lambda second: self._format_timestamp(second, self._datefmt)
+            )
+    
+    def _format_timestamp(self, timestamp: float, format_str: str) -> str:
+        """Format a POSIX timestamp in the configured timezone."""
+        try:
+            dt = datetime.fromtimestamp(timestamp, tz=self._tz)
+        except Exception:
+            # Fallback to UTC if timezone conversion fails
+            dt = datetime.fromtimestamp(timestamp, tz=self._fallback_tz)
+        return dt.strftime(format_str)
     
     def formatTime(self, record, datefmt: str = None) -> str:
         """
@@ -30,23 +83,37 @@ class TimezoneAwareFormatter(ColoredFormatter):
         Returns:
             str: Formatted timestamp string
         """
-        try:
-            # Create datetime from record timestamp
-            dt = datetime.fromtimestamp(record.created, tz=ZoneInfo(self.timezone))
-            
-            # Use provided format or default
-            format_str = datefmt if datefmt else DATE_FORMAT
-            return dt.strftime(format_str)
+        # Use provided format or default
+        format_str = datefmt if datefmt else self._datefmt
+        if self._format_second is not None and format_str == self._datefmt:
+            return self._format_second(int(record.created))
+        return self._format_timestamp(record.created, format_str)
+    
+    def format(self, record) -> str:
+        """
+        Fill in the color fields used by LOG_FORMAT, then format the record.
+        
+        Args:
+            record: Log record
             
-        except Exception as e:
-            # Fallback to UTC if timezone conversion fails
-            dt = datetime.fromtimestamp(record.created, tz=ZoneInfo('UTC'))
-            format_str = datefmt if datefmt else DATE_FORMAT
-            return dt.strftime(format_str)
+        Returns:
+            str: Colored log line
+        """
+        record.log_color = _LEVEL_PREFIX.get(record.levelno, '')
+        record.reset = _RESET
+        record.cyan = _CYAN
+        message = super().format(record)
+        if not message.endswith(_RESET):
+            message += _RESET
+        return message
         
+# Default log level, resolved once at import time
+_LEVEL_INT = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
+
 def setup_logging(log_level=None):
     """
-    Configure logging for the application
+    Configure logging for the application.
+    Repeated calls reuse the installed handler and only update the level.
     
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -56,23 +123,30 @@ def setup_logging(log_level=None):
     """
     # Get log level from environment or use default
     if log_level is None:
-        log_level_name = LOG_LEVEL
-        log_level = getattr(logging, log_level_name.upper(), logging.INFO)
+        log_level = _LEVEL_INT
+    elif isinstance(log_level, str):
+        log_level = getattr(logging, log_level.upper(), logging.INFO)
+    log_level_name = logging.getLevelName(log_level)
     
-    # Clear any existing handlers from the root logger
     root = logging.getLogger()
-    if root.handlers:
-        for handler in root.handlers:
-            root.removeHandler(handler)
+    logger = logging.getLogger("Educational")
+    
+    # Our console handler is installed once; later calls only adjust the level
+    if any(getattr(handler, '_educational_marker', False) for handler in root.handlers):
+        root.setLevel(log_level)
+        logger.setLevel(log_level)
+        return logger
+    
+    # Clear any existing handlers from the root logger
+    root.handlers.clear()
     
     # Create console handler with a specific formatter
     console_handler = logging.StreamHandler(sys.stdout)
+    console_handler._educational_marker = True
     console_formatter = TimezoneAwareFormatter(
         LOG_FORMAT,
         datefmt="%Y-%m-%d %H:%M:%S",
-        reset=True,
-        timezone="Asia/Tehran",
-        log_colors=LOG_COLORS
+        timezone="Asia/Tehran"
     )
     console_handler.setFormatter(console_formatter)
 
@@ -80,8 +154,7 @@ def setup_logging(log_level=None):
     root.setLevel(log_level)
     root.addHandler(console_handler)
     
-    # Get our application logger
-    logger = logging.getLogger("Educational")
+    # Configure our application logger
     logger.setLevel(log_level)
     
     # Add a startup message to verify logging is working